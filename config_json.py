@@ -0,0 +1,21 @@
+"""
+JSON helpers for automation_config.json
+Uses orjson when installed, the standard json module otherwise
+"""
+
+try:
+    import orjson
+    
+    def json_dumps(obj):
+        """Encode obj as indented JSON bytes"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    
+    json_loads = orjson.loads
+except ImportError:  # Optional: fall back to the stdlib encoder
+    import json
+    
+    def json_dumps(obj):
+        """Encode obj as indented JSON bytes"""
+        return json.dumps(obj, indent=2).encode()
+    
+    json_loads = json.loads
@@ -6,8 +6,6 @@ Simple guided setup and automation for FaceFusion face swapping
 
 import os
 import sys
-import subprocess
-import json
 from pathlib import Path
 from datetime import datetime
 
@@ -16,6 +14,7 @@ class FaceFusionAutomationLauncher:
         self.base_dir = Path.cwd()
         self.config_file = self.base_dir / 'automation_config.json'
         self.setup_complete = False
+        self._reqs_ok = None
         
     def show_banner(self):
         print("\n" + "="*60)
@@ -26,40 +25,36 @@ class FaceFusionAutomationLauncher:
         print("="*60)
         
     def check_system_requirements(self):
+        import shutil
+        
+        if self._reqs_ok is not None:
+            return self._reqs_ok
+            
         print("\n🔍 CHECKING SYSTEM REQUIREMENTS...")
+        self._reqs_ok = False
         
         # Check Python 3.11
-        try:
-            result = subprocess.run(['/opt/homebrew/bin/python3.11', '--version'], 
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
-                print("✅ Python 3.11 found")
-            else:
-                print("❌ Python 3.11 not found")
-                return False
-        except FileNotFoundError:
+        if shutil.which('python3.11') or Path('/opt/homebrew/bin/python3.11').exists():
+            print("✅ Python 3.11 found")
+        else:
             print("❌ Python 3.11 not found")
             return False
             
         # Check FFmpeg
-        try:
-            result = subprocess.run(['ffmpeg', '-version'], capture_output=True, text=True)
-            if result.returncode == 0:
-                print("✅ FFmpeg found")
-            else:
-                print("❌ FFmpeg not found")
-                return False
-        except FileNotFoundError:
+        if shutil.which('ffmpeg'):
+            print("✅ FFmpeg found")
+        else:
             print("❌ FFmpeg not found")
             return False
             
         # Check FaceFusion
-        if (self.base_dir / 'facefusion' / 'facefusion.py').exists():
+        if (self.base_dir / 'facefusion' / 'facefusion.py').is_file():
             print("✅ FaceFusion found")
         else:
             print("❌ FaceFusion not found")
             return False
             
+        self._reqs_ok = True
         return True
         
     def guided_setup(self):
@@ -104,18 +99,25 @@ class FaceFusionAutomationLauncher:
     def setup_directories(self):
         print("\n📁 Creating directories...")
         dirs = ['input', 'faces', 'output', 'processed', 'errors', 'queue', 'watch']
+        with os.scandir('.') as it:
+            existing = {e.name for e in it if e.is_dir(follow_symlinks=False)}
         for d in dirs:
-            Path(d).mkdir(exist_ok=True)
+            if d not in existing:
+                Path(d).mkdir(exist_ok=True)
             print(f"   ✅ {d}/")
             
     def check_ai_models(self):
         # Check if basic models exist
         models_dir = self.base_dir / 'facefusion' / '.assets' / 'models'
-        if models_dir.exists() and len(list(models_dir.glob('*.onnx'))) > 0:
-            return True
-        return False
+        try:
+            with os.scandir(models_dir) as it:
+                return any(e.name.lower().endswith('.onnx') and e.is_file() for e in it)
+        except OSError:
+            return False
         
     def download_models(self):
+        import subprocess
+        
         try:
             result = subprocess.run([
                 '/opt/homebrew/bin/python3.11', 
@@ -130,7 +132,14 @@ class FaceFusionAutomationLauncher:
         except Exception as e:
             print(f"❌ Download error: {e}")
             
+    def _load_config(self):
+        from config_json import json_loads
+        
+        return json_loads(self.config_file.read_bytes())
+        
     def create_default_config(self):
+        from config_json import json_dumps
+        
         config = {
             "watch_dir": "./input",
             "output_dir": "./output",
@@ -141,13 +150,15 @@ class FaceFusionAutomationLauncher:
             "auto_start": True,
             "watch_interval": 5,
             "max_retries": 2,
+            "parallel_jobs": max(1, (os.cpu_count() or 2) // 2),
+            "force_reprocess": False,
             "delete_after_process": False,
             "face_mappings": {},
             "default_face": "faces/demo.jpg"
         }
         
-        with open(self.config_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        with open(self.config_file, 'wb') as f:
+            f.write(json_dumps(config))
         print("✅ Configuration file created")
         
     def show_usage_guide(self):
@@ -173,7 +184,7 @@ class FaceFusionAutomationLauncher:
         print("• client.jpg → client_interview.mp4")
         
         print("\n📊 OUTPUT NAMING:")
-        print("my_video.mp4 → my_video_john_20250817_143052.mp4")
+        print("my_video.mp4 → my_video_john_20250817_143052_0.mp4")
         
     def show_processing_menu(self):
         print("\n🚀 FACEFUSION PROCESSING OPTIONS")
@@ -190,20 +201,23 @@ class FaceFusionAutomationLauncher:
         return choice
         
     def run_batch_processing(self):
+        import subprocess
+        from simple_auto_processor import list_videos, list_faces
+        
         print("\n📦 BATCH PROCESSING MODE")
         
         # Check for files
-        input_videos = list(Path('input').glob('*.mp4')) + list(Path('input').glob('*.mov'))
-        face_images = list(Path('faces').glob('*.jpg')) + list(Path('faces').glob('*.png'))
+        input_videos = list_videos('input')
+        face_images = list_faces('faces')
         
         if not input_videos:
             print("❌ No videos found in input/ folder")
-            print("💡 Add video files (.mp4, .mov) to input/ folder")
+            print("💡 Add video files (.mp4, .mov, .avi, .mkv, .webm) to input/ folder")
             return
             
         if not face_images:
             print("❌ No face images found in faces/ folder") 
-            print("💡 Add face images (.jpg, .png) to faces/ folder")
+            print("💡 Add face images (.jpg, .png, .webp) to faces/ folder")
             return
             
         print(f"📊 Found {len(input_videos)} videos and {len(face_images)} faces")
@@ -219,6 +233,8 @@ class FaceFusionAutomationLauncher:
         ], input='1\n', text=True)
         
     def run_watch_mode(self):
+        import subprocess
+        
         print("\n👀 WATCH MODE")
         print("✨ System will monitor watch/ folder for new videos")
         print("🔄 Drop videos in watch/ folder for instant processing")
@@ -255,8 +271,15 @@ class FaceFusionAutomationLauncher:
             
         print("✅ Test files found, starting test...")
         
+        from simple_auto_processor import run_streaming, execution_providers
+        
+        try:
+            config = self._load_config()
+        except (OSError, ValueError):
+            config = {}
+            
         # Run test with enhanced settings
-        result = subprocess.run([
+        returncode, stderr_tail = run_streaming([
             '/opt/homebrew/bin/python3.11',
             'facefusion/facefusion.py',
             'headless-run',
@@ -264,14 +287,14 @@ class FaceFusionAutomationLauncher:
             '--target-path', 'test_input_video.mp4', 
             '--output-path', f'output/test_result_{datetime.now().strftime("%Y%m%d_%H%M%S")}.mp4',
             '--processors', 'face_swapper',
-            '--execution-providers', 'cpu'
-        ], capture_output=True, text=True, timeout=600)
+            '--execution-providers', *execution_providers(config)
+        ], timeout=600)
         
-        if result.returncode == 0:
+        if returncode == 0:
             print("✅ Test successful! Check output/ folder")
         else:
             print("❌ Test failed:")
-            print(result.stderr)
+            print(stderr_tail[-400:])
             
     def show_system_status(self):
         print("\n📋 SYSTEM STATUS")
@@ -280,14 +303,22 @@ class FaceFusionAutomationLauncher:
         # Check directories
         dirs = ['input', 'faces', 'output', 'processed', 'errors']
         for d in dirs:
-            count = len(list(Path(d).glob('*')))
+            try:
+                with os.scandir(d) as it:
+                    count = sum(1 for _ in it)
+            except OSError:
+                count = 0
             print(f"📁 {d}/: {count} files")
             
         # Check config
-        if self.config_file.exists():
-            print("✅ Configuration file exists")
-        else:
+        if not self.config_file.exists():
             print("❌ Configuration file missing")
+        else:
+            try:
+                self._load_config()
+                print("✅ Configuration file exists")
+            except (OSError, ValueError):
+                print("❌ Configuration file is not valid JSON")
             
         # Check models
         if self.check_ai_models():
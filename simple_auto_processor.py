@@ -6,24 +6,189 @@ Works with existing FaceFusion installation or downloads it
 
 import os
 import sys
-import json
+import platform
 import time
-import shutil
 import subprocess
+import queue
+import threading
+from collections import OrderedDict, deque
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 
+from config_json import json_dumps, json_loads
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:  # Optional: watch mode falls back to polling
+    Observer = None
+    FileSystemEventHandler = object
+
+_VIDEO_EXTS = frozenset({'.mp4', '.avi', '.mov', '.mkv', '.webm'})
+_FACE_EXT_ORDER = ('.jpg', '.jpeg', '.png', '.webp')  # Preferred first when stems collide
+_FACE_EXTS = frozenset(_FACE_EXT_ORDER)
+_OUTPUT_EXTS = frozenset({'.mp4'})
+_MANIFEST_NAME = '.manifest.json'  # In output/: output name -> [video name, face name]
+_SEEN_LIMIT = 10000
+_SETTLE_SECONDS = 3  # How long a dropped video must stay unchanged before processing
+_PYTHON_EXE = '/opt/homebrew/bin/python3.11'
+
+def _list_files(dirpath, exts):
+    """List files in dirpath whose extension is in exts (single scandir pass)"""
+    try:
+        with os.scandir(dirpath) as it:
+            return [Path(e.path) for e in it
+                    if e.is_file(follow_symlinks=False)
+                    and os.path.splitext(e.name)[1].lower() in exts]
+    except FileNotFoundError:
+        return []
+
+@lru_cache(maxsize=None)
+def _best_providers():
+    """Fastest ONNX execution providers available here, CPU last as fallback"""
+    if platform.system() == 'Darwin' and platform.machine() == 'arm64':
+        return ('coreml', 'cpu')
+    try:
+        import onnxruntime
+        if 'CUDAExecutionProvider' in onnxruntime.get_available_providers():
+            return ('cuda', 'cpu')
+    except ImportError:
+        pass
+    return ('cpu',)
+
+def execution_providers(config):
+    """Execution providers from config (key: execution_providers), else auto-detected"""
+    providers = config.get('execution_providers')
+    if isinstance(providers, str):
+        providers = providers.split()
+    return list(providers or _best_providers())
+
+def _nonempty(path):
+    """True if path exists and is not empty (single stat call)"""
+    try:
+        return os.stat(path).st_size > 0
+    except OSError:
+        return False
+
+def _file_signature(path):
+    """(size, mtime) of path, None if it is gone"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+def _file_size(path):
+    """Size of path in bytes, 0 if it cannot be read"""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+def list_videos(dirpath):
+    """List video files in dirpath"""
+    return _list_files(dirpath, _VIDEO_EXTS)
+
+def list_faces(dirpath):
+    """List face images in dirpath"""
+    return _list_files(dirpath, _FACE_EXTS)
+
+def run_streaming(cmd, timeout, tail_lines=64):
+    """Run cmd keeping only the last tail_lines of stderr, returns (returncode, stderr_tail)
+
+    Raises subprocess.TimeoutExpired (after killing the process) on timeout.
+    """
+    tail = deque(maxlen=tail_lines)
+    process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                               text=True, bufsize=1, errors='replace')
+    # Drain stderr in the background so wait() can enforce the timeout
+    reader = threading.Thread(target=tail.extend, args=(process.stderr,), daemon=True)
+    reader.start()
+    try:
+        process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+        raise
+    finally:
+        reader.join()
+        process.stderr.close()
+    return process.returncode, ''.join(tail)
+
+class _NewVideoHandler(FileSystemEventHandler):
+    """Push newly created, moved-in or closed videos in watch_dir onto a queue"""
+    def __init__(self, video_queue, watch_dir):
+        super().__init__()
+        self.video_queue = video_queue
+        self.watch_dir = Path(watch_dir)
+        self._watch_dir_abs = os.path.abspath(watch_dir)
+        
+    def _push(self, path):
+        # Ignore paths outside the watched folder, e.g. our own move to processed/
+        if os.path.dirname(os.path.abspath(path)) != self._watch_dir_abs:
+            return
+        if os.path.splitext(path)[1].lower() in _VIDEO_EXTS:
+            # Same form as list_videos() so a file is never queued under two names
+            self.video_queue.put(self.watch_dir / os.path.basename(path))
+            
+    def on_created(self, event):
+        if not event.is_directory:
+            self._push(event.src_path)
+            
+    def on_moved(self, event):
+        if not event.is_directory:
+            self._push(event.dest_path)
+            
+    def on_closed(self, event):
+        # Only reported on some platforms (inotify); the size check covers the rest
+        if not event.is_directory:
+            self._push(event.src_path)
+
 class SimpleAutoProcessor:
     def __init__(self):
         self.base_dir = Path.cwd()
+        self._face_index = None
+        self._faces_ordered = []
+        self._seen = OrderedDict()
+        self.output_dir = Path('output')
+        self.processed_dir = Path('processed')
+        self._manifest = {}
+        self._manifest_lock = threading.Lock()
+        self.config = self.load_config()
         self.setup_directories()
         self.check_facefusion()
         
+    def load_config(self):
+        """Load automation_config.json if present"""
+        config_file = self.base_dir / 'automation_config.json'
+        if not config_file.exists():
+            return {}
+        try:
+            return json_loads(config_file.read_bytes())
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Could not read {config_file.name}: {e}")
+            return {}
+            
+    def max_parallel_jobs(self):
+        """Number of FaceFusion processes to run at once (config key: parallel_jobs)"""
+        # Each FaceFusion process is already multi-threaded through ONNX
+        limit = max(1, (os.cpu_count() or 2) // 2)
+        try:
+            jobs = int(self.config.get('parallel_jobs') or limit)
+        except (TypeError, ValueError):
+            jobs = limit
+        return max(1, min(jobs, limit))
+        
     def setup_directories(self):
         """Create necessary directories"""
         dirs = ['input', 'output', 'processed', 'faces', 'queue']
+        with os.scandir('.') as it:
+            existing = {e.name for e in it if e.is_dir(follow_symlinks=False)}
         for d in dirs:
-            Path(d).mkdir(exist_ok=True)
+            if d not in existing:
+                Path(d).mkdir(exist_ok=True)
             
         print(f"✅ Directories created:")
         print(f"   📁 input/     - Drop videos here")
@@ -34,6 +199,7 @@ class SimpleAutoProcessor:
     def check_facefusion(self):
         """Check if FaceFusion is available"""
         self.facefusion_path = Path('facefusion')
+        self._ff_script = str(self.facefusion_path / 'facefusion.py')
         
         if not self.facefusion_path.exists():
             print("\n⚠️  FaceFusion not found!")
@@ -56,31 +222,216 @@ class SimpleAutoProcessor:
         print("Note: You'll need to install Python dependencies manually")
         print("Run: cd facefusion && pip install -r requirements.txt")
         
+    def _build_face_index(self):
+        """Scan faces folder once, mapping lowercase stem to face path"""
+        faces = sorted(list_faces('faces'),
+                       key=lambda p: (_FACE_EXT_ORDER.index(p.suffix.lower()), p.name))
+        self._faces_ordered = faces
+        face_index = {}
+        for face_path in faces:
+            face_index.setdefault(face_path.stem.lower(), face_path)
+        return face_index
+        
     def find_face_for_video(self, video_path):
         """Find appropriate face image for video"""
+        if self._face_index is None:
+            self._face_index = self._build_face_index()
+            
         video_name = video_path.stem.lower()
         
         # Look for face with same name
-        for ext in ['.jpg', '.jpeg', '.png', '.webp']:
-            face_path = Path('faces') / f"{video_path.stem}{ext}"
-            if face_path.exists():
-                return face_path
+        face_path = self._face_index.get(video_name)
+        if face_path:
+            return face_path
                 
         # Look for keyword match
-        for face_file in Path('faces').glob('*'):
-            if face_file.stem.lower() in video_name:
-                return face_file
+        for face_stem, face_path in self._face_index.items():
+            if face_stem in video_name:
+                return face_path
                 
         # Use first available face
-        faces = list(Path('faces').glob('*.jpg')) + \
-                list(Path('faces').glob('*.jpeg')) + \
-                list(Path('faces').glob('*.png'))
-                
-        if faces:
-            return faces[0]
+        if self._faces_ordered:
+            return self._faces_ordered[0]
             
         return None
         
+    def _output_path_for(self, video_path, face_path, batch_ts, index):
+        """Output path for a video/face pair, unique within a batch through index"""
+        output_name = f"{video_path.stem}_{face_path.stem}_{batch_ts}_{index}.mp4"
+        return self.output_dir / output_name
+        
+    def _load_manifest(self):
+        """Read the record of which video/face pair produced each output"""
+        manifest_path = self.output_dir / _MANIFEST_NAME
+        try:
+            manifest = json_loads(manifest_path.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Could not read {manifest_path}: {e}")
+            return {}
+        return manifest if isinstance(manifest, dict) else {}
+            
+    def _record_output(self, video_path, face_path, output_path):
+        """Remember that output_path was made from video_path and face_path"""
+        with self._manifest_lock:
+            self._manifest[output_path.name] = [video_path.name, face_path.name]
+            try:
+                with open(self.output_dir / _MANIFEST_NAME, 'wb') as f:
+                    f.write(json_dumps(self._manifest))
+            except OSError as e:
+                print(f"⚠️  Could not update {_MANIFEST_NAME}: {e}")
+                
+    def _facefusion_cmd(self, *args):
+        """Build a FaceFusion command line"""
+        return [_PYTHON_EXE, self._ff_script, *args]
+        
+    def _swap_args(self, face_path, video_path, output_path):
+        """Arguments describing one face swap"""
+        return [
+            '--source-paths', str(face_path),
+            '--target-path', str(video_path),
+            '--output-path', str(output_path),
+            '--processors', 'face_swapper'
+        ]
+        
+    def _finish_one(self, face_path, video_path, output_path):
+        """Check the output of a finished swap, record it and move the original to processed"""
+        if not _nonempty(output_path):
+            return False
+            
+        self._record_output(video_path, face_path, output_path)
+        self._move_to_processed(video_path)
+        print(f"   ✅ Success: {output_path.name}")
+        return True
+        
+    def _move_to_processed(self, video_path):
+        """Move an original video to processed"""
+        processed_path = self.processed_dir / video_path.name
+        if not processed_path.exists():  # Avoid overwriting
+            try:
+                os.replace(video_path, processed_path)  # Atomic rename on the same volume
+            except OSError:
+                import shutil
+                shutil.move(str(video_path), str(processed_path))
+        
+    def _run_one(self, face_path, video_path, output_path):
+        """Run FaceFusion on a single video, returns (video_path, output_path or None, error)"""
+        cmd = self._facefusion_cmd(
+            'headless-run',
+            *self._swap_args(face_path, video_path, output_path),
+            '--execution-providers', *execution_providers(self.config)
+        )
+        
+        print(f"   🎬 Processing: {video_path.name}")
+        
+        try:
+            # Run with progress tracking
+            returncode, stderr_tail = run_streaming(cmd, timeout=1800)  # 30 min timeout
+            
+            if self._finish_one(face_path, video_path, output_path):
+                return video_path, output_path, None
+            
+            print(f"   ❌ Failed: {video_path.name} (exit code {returncode})")
+            if stderr_tail:
+                print(f"      Error: ...{stderr_tail[-400:]}")  # Show last 400 chars
+            return video_path, None, stderr_tail
+                    
+        except subprocess.TimeoutExpired as e:
+            print(f"   ⏱️ Timeout: {video_path.name} (processing took too long)")
+            return video_path, None, e
+        except Exception as e:
+            print(f"   ❌ Error processing {video_path.name}: {str(e)[:100]}...")
+            return video_path, None, e
+            
+    def _run_job(self, job_id, steps):
+        """Run several swaps as one FaceFusion job so models load only once
+
+        steps is a list of (face_path, video_path, output_path). Steps that
+        cannot be added to the job or have no output after a failed job-run,
+        or all of them if the job cannot be created or submitted, fall back
+        to one headless-run per video.
+        """
+        def job_cmd(*args):
+            try:
+                result = subprocess.run(self._facefusion_cmd(*args), capture_output=True, text=True)
+            except OSError as e:
+                print(f"   ⚠️  FaceFusion {args[0]} failed: {e}")
+                return False
+            if result.returncode != 0:
+                print(f"   ⚠️  FaceFusion {args[0]} failed (exit code {result.returncode})")
+                if result.stderr.strip():
+                    print(f"      Error: ...{result.stderr.strip()[-400:]}")  # Show last 400 chars
+            return result.returncode == 0
+            
+        if not job_cmd('job-create', job_id):
+            print(f"   ⚠️  Could not create job {job_id}, processing videos one by one")
+            return [self._run_one(*step) for step in steps]
+            
+        queued = []
+        fallback = []
+        for step in steps:
+            if job_cmd('job-add-step', job_id, *self._swap_args(*step)):
+                queued.append(step)
+                print(f"   🎬 Queued: {step[1].name}")
+            else:
+                fallback.append(step)
+                
+        if queued and not job_cmd('job-submit', job_id):
+            fallback = steps
+            queued = []
+            
+        if not queued:
+            # Nothing left to run in the job, drop the draft
+            job_cmd('job-delete', job_id)
+            print(f"   ⚠️  Job {job_id} not submitted, processing videos one by one")
+            return [self._run_one(*step) for step in fallback]
+        
+        stderr_tail = ''
+        job_ok = False
+        try:
+            cmd = self._facefusion_cmd('job-run', job_id,
+                                       '--execution-providers', *execution_providers(self.config))
+            returncode, stderr_tail = run_streaming(cmd, timeout=1800 * len(queued))  # 30 min per video
+            job_ok = returncode == 0
+            if not job_ok:
+                print(f"   ⚠️  Job {job_id} failed (exit code {returncode})")
+        except subprocess.TimeoutExpired:
+            print(f"   ⏱️ Timeout: job {job_id} (processing took too long)")
+        except Exception as e:
+            print(f"   ❌ Error running job {job_id}: {str(e)[:100]}...")
+            
+        if not job_ok:
+            # FaceFusion stops a job at its first failing step and discards the
+            # outputs of the steps before it, so redo the unfinished ones singly
+            if stderr_tail:
+                print(f"      Error: ...{stderr_tail[-400:]}")  # Show last 400 chars
+            unfinished = [step for step in queued if not _nonempty(step[2])]
+            queued = [step for step in queued if _nonempty(step[2])]
+            fallback = unfinished + fallback
+            stderr_tail = ''
+            
+        results = []
+        for face_path, video_path, output_path in queued:
+            try:
+                finished = self._finish_one(face_path, video_path, output_path)
+            except Exception as e:
+                print(f"   ❌ Error processing {video_path.name}: {str(e)[:100]}...")
+                results.append((video_path, None, e))
+                continue
+            if finished:
+                results.append((video_path, output_path, None))
+            else:
+                print(f"   ❌ Failed: {video_path.name}")
+                results.append((video_path, None, stderr_tail))
+        if stderr_tail and any(output_path is None for _, output_path, _ in results):
+            print(f"      Error: ...{stderr_tail[-400:]}")  # Show last 400 chars
+            
+        if fallback:
+            print(f"   ⚠️  {len(fallback)} videos did not finish in job {job_id}, processing them one by one")
+            results.extend(self._run_one(*step) for step in fallback)
+        return results
+        
     def process_videos_batch(self, video_face_pairs):
         """Process multiple videos using FaceFusion's batch mode for better performance"""
         if not video_face_pairs:
@@ -88,77 +439,68 @@ class SimpleAutoProcessor:
             
         print(f"\n🚀 Batch Processing {len(video_face_pairs)} videos with FaceFusion native batch mode...")
         
-        # Create batch directories
-        batch_dir = Path('batch_temp')
-        batch_dir.mkdir(exist_ok=True)
-        
         success_results = []
         
-        try:
-            # Group videos by face for efficient batch processing
-            face_groups = {}
-            for video_path, face_path in video_face_pairs:
-                face_key = str(face_path)
-                if face_key not in face_groups:
-                    face_groups[face_key] = []
-                face_groups[face_key].append(video_path)
-            
-            # Process each face group in batch
-            for face_path_str, videos in face_groups.items():
-                face_path = Path(face_path_str)
-                print(f"\n🎭 Processing {len(videos)} videos with face: {face_path.name}")
-                
-                # Build FaceFusion batch command
-                python_exe = '/opt/homebrew/bin/python3.11'
-                
-                for video_path in videos:
-                    # Generate output name
-                    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                    output_name = f"{video_path.stem}_{face_path.stem}_{timestamp}.mp4"
-                    output_path = Path('output') / output_name
-                    
-                    # Use FaceFusion's optimized processing
-                    cmd = [
-                        python_exe,
-                        str(self.facefusion_path / 'facefusion.py'),
-                        'headless-run',
-                        '--source-paths', str(face_path),
-                        '--target-path', str(video_path),
-                        '--output-path', str(output_path),
-                        '--processors', 'face_swapper',
-                        '--execution-providers', 'cpu'
-                    ]
-                    
-                    print(f"   🎬 Processing: {video_path.name}")
-                    
+        # Group videos by face for efficient batch processing
+        face_groups = {}
+        for video_path, face_path in video_face_pairs:
+            face_key = str(face_path)
+            if face_key not in face_groups:
+                face_groups[face_key] = []
+            face_groups[face_key].append(video_path)
+            
+        # Outputs left over from earlier runs, so finished work is not redone
+        with self._manifest_lock:
+            self._manifest = self._load_manifest()
+            done_outputs = {}
+            if not self.config.get('force_reprocess', False):
+                existing = {p.name for p in _list_files(self.output_dir, _OUTPUT_EXTS) if _nonempty(p)}
+                done_outputs = {tuple(pair): self.output_dir / name
+                                for name, pair in self._manifest.items() if name in existing}
+            
+        batch_ts = datetime.now().strftime('%Y%m%d_%H%M%S')
+        steps = []
+        # Biggest face groups first so their face image and models stay in
+        # the page cache; smallest videos first within a group so errors surface early
+        for face_path_str, videos in sorted(face_groups.items(), key=lambda kv: -len(kv[1])):
+            face_path = Path(face_path_str)
+            print(f"\n🎭 Queueing {len(videos)} videos with face: {face_path.name}")
+            for video_path in sorted(videos, key=_file_size):
+                done_path = done_outputs.get((video_path.name, face_path.name))
+                if done_path:
+                    print(f"   ⏭️  Skipping already processed: {video_path.name}")
                     try:
-                        # Run with progress tracking
-                        result = subprocess.run(cmd, capture_output=True, text=True, timeout=1800)  # 30 min timeout
-                        
-                        if output_path.exists() and output_path.stat().st_size > 0:
-                            print(f"   ✅ Success: {output_path.name}")
-                            
-                            # Move original to processed
-                            processed_path = Path('processed') / video_path.name
-                            if not processed_path.exists():  # Avoid overwriting
-                                shutil.move(str(video_path), str(processed_path))
-                            
-                            success_results.append((video_path, output_path))
-                        else:
-                            print(f"   ❌ Failed: {video_path.name}")
-                            if result.stderr:
-                                print(f"      Error: {result.stderr[:200]}...")  # Show first 200 chars
-                                
-                    except subprocess.TimeoutExpired:
-                        print(f"   ⏱️ Timeout: {video_path.name} (processing took too long)")
+                        self._move_to_processed(video_path)
                     except Exception as e:
-                        print(f"   ❌ Error processing {video_path.name}: {str(e)[:100]}...")
-                        
-        finally:
-            # Cleanup batch directory
-            if batch_dir.exists():
-                shutil.rmtree(batch_dir, ignore_errors=True)
-                
+                        print(f"   ❌ Error moving {video_path.name}: {str(e)[:100]}...")
+                        continue
+                    success_results.append((video_path, done_path))
+                    continue
+                output_path = self._output_path_for(video_path, face_path, batch_ts, len(steps))
+                steps.append((face_path, video_path, output_path))
+        
+        if not steps:
+            return success_results
+            
+        # One FaceFusion job per worker, split into contiguous chunks so
+        # videos sharing a face stay in the same job
+        max_workers = min(self.max_parallel_jobs(), len(steps))
+        chunk_size = -(-len(steps) // max_workers)
+        chunks = [steps[i:i + chunk_size] for i in range(0, len(steps), chunk_size)]
+        print(f"⚙️  Running {len(chunks)} FaceFusion jobs in parallel")
+        
+        job_prefix = f"batch_{batch_ts}"
+        
+        # Each job blocks on its own FaceFusion subprocess, so threads are enough
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self._run_job, f"{job_prefix}_{i}", chunk)
+                       for i, chunk in enumerate(chunks)]
+                    
+            for future in as_completed(futures):
+                for video_path, output_path, _ in future.result():
+                    if output_path:
+                        success_results.append((video_path, output_path))
+            
         return success_results
         
     def process_video(self, video_path, face_path):
@@ -168,9 +510,8 @@ class SimpleAutoProcessor:
     def run_batch(self):
         """Process all videos in input folder using optimized batch processing"""
         # Check for face images
-        face_files = list(Path('faces').glob('*.jpg')) + \
-                    list(Path('faces').glob('*.jpeg')) + \
-                    list(Path('faces').glob('*.png'))
+        self._face_index = self._build_face_index()
+        face_files = self._faces_ordered
                     
         if not face_files:
             print("\n❌ No face images found in 'faces' folder!")
@@ -178,11 +519,7 @@ class SimpleAutoProcessor:
             return
             
         # Find videos
-        video_extensions = ['.mp4', '.avi', '.mov', '.mkv', '.webm']
-        video_files = []
-        
-        for ext in video_extensions:
-            video_files.extend(Path('input').glob(f'*{ext}'))
+        video_files = list_videos('input')
             
         if not video_files:
             print("\n❌ No videos found in 'input' folder!")
@@ -236,43 +573,132 @@ class SimpleAutoProcessor:
             for video in skipped_videos[:3]:  # Show first 3
                 print(f"   📄 {video.name}")
         
+    def _collect_video_face_pairs(self, video_files):
+        """Split videos into (video, face) pairs and videos still waiting for a face"""
+        self._face_index = self._build_face_index()
+        pairs = []
+        waiting = []
+        for video_path in video_files:
+            face_path = self.find_face_for_video(video_path)
+            
+            if face_path:
+                print(f"\n🆕 New video detected: {video_path.name}")
+                pairs.append((video_path, face_path))
+            else:
+                print(f"\n⚠️  No face for {video_path.name}, waiting...")
+                waiting.append(video_path)
+        return pairs, waiting
+        
     def watch_mode(self):
         """Simple watch mode"""
         print("\n👀 Watch Mode Active!")
         print("Drop videos in 'input' folder and they'll be processed automatically")
         print("Press Ctrl+C to stop")
         
-        processed = set()
-        
+        try:
+            if Observer is None or not self._watch_events():
+                self._watch_poll()
+        except KeyboardInterrupt:
+            print("\n\n👋 Watch mode stopped")
+            
+    def _watch_events(self):
+        """Process videos as file system events report them, returns False if events are unavailable"""
+        video_queue = queue.Queue()
+        observer = Observer()
+        try:
+            observer.schedule(_NewVideoHandler(video_queue, 'input'), 'input', recursive=False)
+            observer.start()
+        except OSError as e:
+            print(f"⚠️  File system events unavailable ({e}), falling back to polling")
+            return False
+            
+        # Videos already sitting in input/ count as new
+        for video_path in list_videos('input'):
+            video_queue.put(video_path)
+            
+        pending = {}  # video -> ((size, mtime), time it was first seen with them)
+        waiting = []  # videos without a face yet, or that failed
+        next_retry = time.monotonic() + 5
         try:
             while True:
-                # Check for new videos
-                video_files = []
-                for ext in ['.mp4', '.avi', '.mov', '.mkv', '.webm']:
-                    video_files.extend(Path('input').glob(f'*{ext}'))
+                try:
+                    pending[video_queue.get(timeout=1)] = (None, time.monotonic())
+                    while True:
+                        pending[video_queue.get_nowait()] = (None, time.monotonic())
+                except queue.Empty:
+                    pass
                     
-                # Collect new files for batch processing
-                new_video_face_pairs = []
-                for video_path in video_files:
-                    if str(video_path) not in processed:
-                        face_path = self.find_face_for_video(video_path)
+                # A video is ready once its size and mtime held still for
+                # _SETTLE_SECONDS, so files still being copied are left alone
+                now = time.monotonic()
+                ready = []
+                for video_path, (last_signature, since) in list(pending.items()):
+                    signature = _file_signature(video_path)
+                    if signature is None:
+                        del pending[video_path]
+                    elif signature != last_signature:
+                        pending[video_path] = (signature, now)
+                    elif signature[0] > 0 and now - since >= _SETTLE_SECONDS:
+                        del pending[video_path]
+                        ready.append(video_path)
                         
-                        if face_path:
-                            print(f"\n🆕 New video detected: {video_path.name}")
-                            new_video_face_pairs.append((video_path, face_path))
-                        else:
-                            print(f"\n⚠️  No face for {video_path.name}, waiting...")
+                # Retry waiting videos every 5 seconds
+                if waiting and time.monotonic() >= next_retry:
+                    ready.extend(waiting)
+                    waiting = []
+                if not ready:
+                    continue
+                next_retry = time.monotonic() + 5
+                
+                video_files = [p for p in dict.fromkeys(ready) if p.exists()]
+                new_video_face_pairs, waiting_for_face = self._collect_video_face_pairs(video_files)
+                waiting.extend(waiting_for_face)
                 
                 # Process new videos in batch if any found
                 if new_video_face_pairs:
-                    successful_results = self.process_videos_batch(new_video_face_pairs)
-                    for video_path, _ in successful_results:
-                        processed.add(str(video_path))
-                            
-                time.sleep(5)  # Check every 5 seconds
+                    successful = {video_path for video_path, _ in self.process_videos_batch(new_video_face_pairs)}
+                    waiting.extend(video_path for video_path, _ in new_video_face_pairs
+                                   if video_path not in successful and video_path.exists())
+        finally:
+            observer.stop()
+            observer.join()
+            
+    def _file_key(self, path):
+        """Identify a file by (device, inode, mtime), None if it is gone"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st.st_dev, st.st_ino, st.st_mtime_ns
+        
+    def _mark_seen(self, key):
+        """Remember a processed file, forgetting the oldest beyond _SEEN_LIMIT"""
+        self._seen[key] = None
+        while len(self._seen) > _SEEN_LIMIT:
+            self._seen.popitem(last=False)
+            
+    def _watch_poll(self):
+        """Re-scan the input folder every 5 seconds"""
+        previous_keys = {}
+        
+        while True:
+            # Check for new videos, skipping files changed since the last scan
+            # (still being copied)
+            keys = {p: self._file_key(p) for p in list_videos('input')}
+            video_files = [p for p, key in keys.items()
+                           if key and key not in self._seen and previous_keys.get(p) == key]
+            previous_keys = keys
                 
-        except KeyboardInterrupt:
-            print("\n\n👋 Watch mode stopped")
+            # Collect new files for batch processing
+            new_video_face_pairs, _ = self._collect_video_face_pairs(video_files)
+            
+            # Process new videos in batch if any found
+            if new_video_face_pairs:
+                successful_results = self.process_videos_batch(new_video_face_pairs)
+                for video_path, _ in successful_results:
+                    self._mark_seen(keys[video_path])
+                        
+            time.sleep(5)  # Check every 5 seconds
 
 def main():
     print("╔══════════════════════════════════════════╗")